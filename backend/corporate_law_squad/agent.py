@@ -7,15 +7,42 @@ provide comprehensive guidance on LLC vs S-Corp vs C-Corp decisions.
 
 Architecture:
     - Three specialist agents (Tax CPA, Corporate Attorney, Business Strategist)
+    - A combined panel agent that answers for all three in one structured call
     - One coordinator agent that orchestrates parallel consultation and synthesis
     - All agents powered by Gemini 2.5 Flash for fast, cost-effective inference
+    - Exact-match and semantic response caches in front of the coordinator
 
 Usage:
-    The root_agent serves as the entry point for user interactions and delegates
-    to specialist sub-agents as needed.
+    The root_agent serves as the entry point for user interactions and consults
+    the specialist agents through the consult_specialists tool, which answers
+    standard questions with the combined panel and fans the three specialists
+    out concurrently for in-depth ones.
 """
 
+import asyncio
+import logging
+import re
+from collections import OrderedDict
+
 from google.adk.agents import Agent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.tools import ToolContext
+from google.adk.tools.agent_tool import AgentTool
+from google.genai import types
+from pydantic import BaseModel, Field, ValidationError
+
+from .llm_cache import LLMCache
+from .prompts import (
+    COMBINED_INSTRUCTION,
+    COORDINATOR_INSTRUCTION,
+    LEGAL_INSTRUCTION,
+    STRATEGY_INSTRUCTION,
+    TAX_INSTRUCTION,
+)
+from .semantic_cache import SemanticCache
+
+
+logger = logging.getLogger(__name__)
 
 
 # ============================================================================
@@ -28,12 +55,7 @@ tax_agent = Agent(
     name="TaxCPA",
     model="gemini-flash-latest",
     description="Expert tax CPA specializing in corporate tax strategy",
-    instruction=(
-        "You are a seasoned tax CPA.\n"
-        "Analyze LLC vs S-Corp vs C-Corp taxation, pass-through vs double taxation, "
-        "QBI deductions, state tax implications, payroll/self-employment taxes.\n"
-        "Provide concrete tax impacts and clear trade-offs."
-    ),
+    instruction=TAX_INSTRUCTION,
 )
 
 
@@ -43,12 +65,7 @@ legal_agent = Agent(
     name="CorporateAttorney",
     model="gemini-flash-latest",
     description="Corporate attorney specializing in business formation and compliance",
-    instruction=(
-        "You are a corporate attorney.\n"
-        "Assess liability protection, ownership flexibility, operating agreements, "
-        "annual compliance, state registration, and funding implications.\n"
-        "Highlight legal risks and protection mechanisms."
-    ),
+    instruction=LEGAL_INSTRUCTION,
 )
 
 
@@ -58,43 +75,215 @@ strategy_agent = Agent(
     name="BusinessStrategist",
     model="gemini-flash-latest",
     description="Business consultant focused on formation strategy and growth",
-    instruction=(
-        "You are a business strategist.\n"
-        "Consider growth trajectory (bootstrap vs VC), industry regulation, ops complexity, "
-        "state selection (Delaware vs home), employee equity/ESOPs, and exit paths.\n"
-        "Prioritize scalability and practical execution."
-    ),
+    instruction=STRATEGY_INSTRUCTION,
 )
 
 
+# Combined Specialist Panel
+# Produces all three analyses in a single structured Gemini call. Used for
+# standard multi-domain questions; high-stakes questions still fan out to the
+# individual specialists for deeper, independent reasoning.
+class PanelAnalysis(BaseModel):
+    tax: str = Field(description="The tax CPA's analysis")
+    legal: str = Field(description="The corporate attorney's analysis")
+    strategy: str = Field(description="The business strategist's analysis")
+
+
+combined_agent = Agent(
+    name="SpecialistPanel",
+    model="gemini-flash-latest",
+    description="Tax, legal, and strategy analyses produced in a single pass",
+    instruction=COMBINED_INSTRUCTION,
+    output_schema=PanelAnalysis,
+)
+
+
+# ============================================================================
+# SPECIALIST PANEL
+# ============================================================================
+
+# Each specialist is wrapped as an AgentTool so the coordinator keeps ownership of
+# the conversation (clarification, synthesis) while the specialists run as tools.
+SPECIALIST_TOOLS = tuple(
+    AgentTool(agent=agent) for agent in (tax_agent, legal_agent, strategy_agent)
+)
+COMBINED_TOOL = AgentTool(agent=combined_agent)
+
+
+# Keyword rules that mark a query as touching a specialist's domain. A query that
+# touches exactly one domain is routed to that specialist alone; anything else,
+# and every question that mentions an entity type, goes to the full panel.
+_ENTITY_CHOICE_PATTERN = re.compile(
+    r"\b(entity|entities|structure|llcs?|[sc]\s*-?\s*corp(oration)?s?|"
+    r"corporations?|sole\s+prop\w*|partnerships?|incorporat\w*)\b",
+    re.IGNORECASE,
+)
+_DOMAIN_PATTERNS = {
+    tax_agent.name: re.compile(
+        r"\b(tax(es|ation)?|irs|qbi|deduct(ion|ions|ible)|payroll|"
+        r"self-employment|pass-through|double taxation)\b",
+        re.IGNORECASE,
+    ),
+    legal_agent.name: re.compile(
+        r"\b(liabilit(y|ies)|lawsuits?|operating agreements?|bylaws|compliance|"
+        r"registered agent|contracts?|legal)\b",
+        re.IGNORECASE,
+    ),
+    strategy_agent.name: re.compile(
+        r"\b(vc|venture|investors?|fundrais\w*|growth|scal(e|ing|ability)|"
+        r"esops?|exit|acquisition|ipo)\b",
+        re.IGNORECASE,
+    ),
+}
+
+
+def route_specialists(query: str) -> tuple[AgentTool, ...]:
+    """Select the specialists a query needs, defaulting to the full panel."""
+    if _ENTITY_CHOICE_PATTERN.search(query):
+        return SPECIALIST_TOOLS
+    matched = tuple(
+        tool for tool in SPECIALIST_TOOLS if _DOMAIN_PATTERNS[tool.name].search(query)
+    )
+    return matched if len(matched) == 1 else SPECIALIST_TOOLS
+
+
+async def consult_specialists(
+    query: str, tool_context: ToolContext, in_depth: bool = False
+) -> dict:
+    """Consult the TaxCPA, CorporateAttorney, and BusinessStrategist.
+
+    Questions confined to a single domain (e.g. purely about taxes) are answered
+    by that specialist alone.
+
+    Args:
+        query: The user's business situation and question, including every
+            clarification gathered so far.
+        in_depth: Set for high-stakes decisions (fundraising, multi-owner equity,
+            regulated industries) so each specialist reasons independently
+            instead of the panel answering in one combined pass.
+
+    Returns:
+        A mapping of specialist name to that specialist's analysis.
+    """
+    specialists = route_specialists(query)
+    if len(specialists) > 1 and not in_depth:
+        # One structured call instead of three round trips.
+        try:
+            panel = await COMBINED_TOOL.run_async(
+                args={"request": query}, tool_context=tool_context
+            )
+            return {
+                tax_agent.name: panel["tax"],
+                legal_agent.name: panel["legal"],
+                strategy_agent.name: panel["strategy"],
+            }
+        except (TypeError, KeyError, ValidationError) as error:
+            # Empty ("") or malformed panel output: consult each specialist instead.
+            logger.warning("Combined panel output unusable, fanning out: %s", error)
+
+    # The specialists have no data dependencies on each other, so running them
+    # concurrently bounds latency by the slowest specialist rather than the sum.
+    analyses = await asyncio.gather(
+        *(
+            tool.run_async(args={"request": query}, tool_context=tool_context)
+            for tool in specialists
+        )
+    )
+    return {tool.name: analysis for tool, analysis in zip(specialists, analyses)}
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+# Shared across sessions: identical conversations get identical answers, so a
+# repeated conversation (same query, same questions asked, same answers given)
+# skips the coordinator entirely.
+# Paraphrased opening queries fall through to the semantic cache; follow-up
+# turns use exact matches only, since a short answer ("yes", "2") barely moves
+# an embedding and would match the previous turn or an opposite answer.
+response_cache = LLMCache()
+semantic_cache = SemanticCache()
+
+# Opening-query embeddings computed on a miss, keyed by invocation id, so the
+# answer can be cached without embedding the query a second time. Runs
+# that fail or are abandoned never reach cache_response, so the map is bounded
+# and the oldest pending embedding is dropped once it is full.
+_pending_embeddings = OrderedDict()
+MAX_PENDING_EMBEDDINGS = 256
+
+# Opening queries longer than this many characters (roughly 1,000 tokens, well
+# inside the embedding model's 2,048-token input limit) skip the semantic cache
+# and use exact matches only, so embedding input and cost stay bounded.
+MAX_SEMANTIC_QUERY_CHARS = 4000
+
+
+def _conversation_key(callback_context: CallbackContext) -> str:
+    """Cache key for the conversation so far: every user turn and coordinator reply."""
+    return LLMCache.make_key(root_agent.model, callback_context.state["conversation"])
+
+
+async def serve_cached_response(callback_context: CallbackContext) -> types.Content | None:
+    """Record the user's turn and answer it from the caches when possible."""
+    user_content = callback_context.user_content
+    turn = "".join(part.text or "" for part in user_content.parts or ()) if user_content else ""
+    # The conversation is stored as [role, text] pairs, alternating between the
+    # user's turns and the coordinator's replies (a failed turn leaves no reply).
+    conversation = [*callback_context.state.get("conversation", []), ["user", turn]]
+    callback_context.state["conversation"] = conversation
+    # Reset so a failed turn can never cache the previous turn's answer.
+    callback_context.state["recommendation"] = ""
+
+    cached = response_cache.get(_conversation_key(callback_context))
+    if cached is None:
+        # Only the opening query is matched semantically.
+        if len(conversation) > 1 or len(turn) > MAX_SEMANTIC_QUERY_CHARS:
+            return None
+        embedding = await semantic_cache.embed(turn)
+        if embedding is None:
+            return None
+        cached = semantic_cache.get(embedding)
+        if cached is None:
+            _pending_embeddings[callback_context.invocation_id] = embedding
+            if len(_pending_embeddings) > MAX_PENDING_EMBEDDINGS:
+                _pending_embeddings.popitem(last=False)
+            return None
+    callback_context.state["conversation"] = [*conversation, ["model", cached]]
+    return types.Content(role="model", parts=[types.Part(text=cached)])
+
+
+def cache_response(callback_context: CallbackContext) -> None:
+    """Store the coordinator's final answer for this conversation."""
+    embedding = _pending_embeddings.pop(callback_context.invocation_id, None)
+    recommendation = callback_context.state.get("recommendation")
+    if not recommendation:
+        return
+    response_cache.set(_conversation_key(callback_context), recommendation)
+    if embedding is not None:
+        semantic_cache.set(embedding, recommendation)
+    # Record the reply after keying on the conversation it answers.
+    callback_context.state["conversation"] = [
+        *callback_context.state["conversation"],
+        ["model", recommendation],
+    ]
+
+
 # ============================================================================
 # COORDINATOR AGENT (Entry Point)
 # ============================================================================
 
 # Root Coordinator Agent
 # Orchestrates the multi-agent consultation workflow and synthesizes recommendations.
-# This is the main interface that users interact with - it delegates to specialist
-# agents in parallel, resolves conflicts, and produces unified recommendations.
+# This is the main interface that users interact with - it consults the specialists
+# (one specialist, the combined panel, or a parallel fan-out, depending on the
+# question), resolves conflicts, and produces unified recommendations.
 root_agent = Agent(
     name="BetterCallSaulCoordinator",
     model="gemini-flash-latest",
     description="Lead consultant coordinating the corporate-law squad",
-    instruction=(
-        "You coordinate specialists to recommend the best entity and plan.\n"
-        "Workflow:\n"
-        "1) Clarify the user's business context\n"
-        "2) Consult TaxCPA, CorporateAttorney, and BusinessStrategist (in parallel when possible)\n"
-        "3) Identify conflicts (e.g., tax efficiency vs fundraising norms)\n"
-        "4) Synthesize a unified plan with trade-offs and costs\n"
-        "5) Present clear next steps\n\n"
-        "Respond using this format:\n\n"
-        "**Recommended Structure:** [Entity Type]\n\n"
-        "**Key Benefits:**\n"
-        "- [Benefit 1]\n- [Benefit 2]\n- [Benefit 3]\n\n"
-        "**Trade-offs:**\n"
-        "- [Trade-off 1]\n- [Trade-off 2]\n\n"
-        "**Next Steps:**\n"
-        "1) [Action 1]\n2) [Action 2]\n3) [Action 3]\n"
-    ),
-    sub_agents=[tax_agent, legal_agent, strategy_agent],
+    instruction=COORDINATOR_INSTRUCTION,
+    tools=[consult_specialists],
+    output_key="recommendation",
+    before_agent_callback=serve_cached_response,
+    after_agent_callback=cache_response,
 )
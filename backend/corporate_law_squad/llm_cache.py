@@ -0,0 +1,74 @@
+"""
+Response cache for the Better Call Saul coordinator.
+
+Memoizes complete coordinator responses keyed by the conversation that produced
+them (every user turn and coordinator reply, in order). A repeated
+conversation is answered from memory instead of re-running the coordinator and
+the three specialist consultations behind it.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import timedelta
+
+
+class LLMCache:
+    """Exact-match, in-memory LRU response cache with a sliding TTL.
+
+    Entries are kept in least-recently-used order. Every hit refreshes the TTL, so
+    that order is also expiry order: expired entries always sit at the front and
+    are evicted in time proportional to how many expired, not to cache size.
+
+    Args:
+        ttl: How long a cached response stays valid after its last use.
+        max_entries: Upper bound on cached responses; the least recently used
+            entry is evicted once the bound is reached.
+    """
+
+    def __init__(self, ttl=timedelta(minutes=30), max_entries=1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def make_key(model: str, turns: list[list[str]]) -> str:
+        """Build the SHA-256 cache key for a conversation.
+
+        Args:
+            model: The model answering the conversation.
+            turns: The conversation as ordered [role, text] pairs. The coordinator's
+                replies are part of the key because a short answer such as "2"
+                only means something next to the question it answers.
+        """
+        payload = json.dumps({"model": model, "turns": turns}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for key, or None if absent or expired."""
+        self._evict_expired()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        _, response = entry
+        self._entries[key] = (time.monotonic() + self.ttl.total_seconds(), response)
+        self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: str) -> None:
+        """Cache response under key, evicting the least recently used entry when full."""
+        self._evict_expired()
+        self._entries[key] = (time.monotonic() + self.ttl.total_seconds(), response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _evict_expired(self) -> None:
+        """Drop expired entries from the front of the LRU order."""
+        now = time.monotonic()
+        while self._entries:
+            expires_at, _ = next(iter(self._entries.values()))
+            if expires_at > now:
+                break
+            self._entries.popitem(last=False)
@@ -0,0 +1,137 @@
+"""
+Semantic response cache for the Better Call Saul coordinator.
+
+Catches paraphrases that the exact-match LLMCache misses ("Should I form an LLC
+for my SaaS startup?" vs "LLC or C-Corp for a software company?"). Opening
+queries are embedded once and compared by cosine similarity against previously
+answered ones; a close enough match is answered from memory, trading one cheap
+embedding call for the coordinator and specialist calls.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from datetime import timedelta
+
+import httpx
+import numpy as np
+from google import genai
+from google.genai import errors, types
+
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "gemini-embedding-001"
+EMBEDDING_DIMENSIONS = 768
+# A lookup that takes longer than this is treated as a miss so a slow or hung
+# embedding request can't hold up the coordinator.
+EMBEDDING_TIMEOUT_SECONDS = 2.0
+
+
+# HTTP statuses that are routine under load (rate limiting, overload, timeout).
+_TRANSIENT_STATUS_CODES = frozenset({429, 503, 504})
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether an embedding failure is an expected upstream hiccup."""
+    if isinstance(error, errors.APIError):
+        return error.code in _TRANSIENT_STATUS_CODES
+    return isinstance(error, (httpx.TimeoutException, asyncio.TimeoutError))
+
+
+@functools.cache
+def get_client() -> genai.Client:
+    """Return the shared Gemini client, created on first use rather than at import."""
+    return genai.Client()
+
+
+class SemanticCache:
+    """Embedding-similarity response cache with a TTL and a size bound.
+
+    The cache is shared across sessions, so a hit hands one user's answer to
+    another user whose query merely reads alike; two queries that differ only in
+    a figure ("$150K" vs "$1.5M") can score above the threshold. The default
+    threshold of 0.92 has not been calibrated for gemini-embedding-001: raise it
+    to trade hit rate for fewer wrong-situation answers.
+
+    Args:
+        threshold: Minimum cosine similarity for a cached response to be reused.
+        ttl: How long a cached response stays valid.
+        max_entries: Upper bound on cached responses; the oldest entry is evicted
+            once the bound is reached.
+    """
+
+    def __init__(self, threshold=0.92, ttl=timedelta(minutes=30), max_entries=1024):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # Row i of _embeddings belongs to _entries[i]; both are kept in insertion
+        # (and therefore expiry) order.
+        self._embeddings = np.empty((0, EMBEDDING_DIMENSIONS), dtype=np.float32)
+        self._entries: list[tuple[float, str]] = []
+
+    async def embed(self, text: str) -> np.ndarray | None:
+        """Embed text as a unit vector, or return None if embedding fails."""
+        try:
+            result = await asyncio.wait_for(
+                get_client().aio.models.embed_content(
+                    model=EMBEDDING_MODEL,
+                    contents=text,
+                    config=types.EmbedContentConfig(
+                        task_type="SEMANTIC_SIMILARITY",
+                        output_dimensionality=EMBEDDING_DIMENSIONS,
+                    ),
+                ),
+                timeout=EMBEDDING_TIMEOUT_SECONDS,
+            )
+            vector = np.asarray(result.embeddings[0].values, dtype=np.float32)
+        except Exception as error:
+            # The cache is best-effort: any failure (API, transport, auth, or an
+            # empty response) is just a miss. Only unexpected failures are worth
+            # the cost of formatting a traceback.
+            if _is_transient(error):
+                logger.warning(
+                    "Embedding request for semantic cache lookup failed (%s): %s",
+                    type(error).__name__,
+                    error,
+                )
+            else:
+                logger.exception("Embedding request for semantic cache lookup failed")
+            return None
+        norm = np.linalg.norm(vector)
+        if vector.shape != (EMBEDDING_DIMENSIONS,) or not norm:
+            logger.warning("Semantic cache lookup got an unusable embedding")
+            return None
+        # Truncated embeddings are not normalized, so normalize for cosine scores.
+        return vector / norm
+
+    def get(self, embedding: np.ndarray) -> str | None:
+        """Return the most similar cached response above the threshold, if any."""
+        self._evict_expired()
+        if not self._entries:
+            return None
+        scores = self._embeddings @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        return self._entries[best][1]
+
+    def set(self, embedding: np.ndarray, response: str) -> None:
+        """Cache response under embedding, evicting the oldest entry when full."""
+        self._evict_expired()
+        if len(self._entries) >= self.max_entries:
+            self._embeddings = self._embeddings[1:]
+            del self._entries[0]
+        self._embeddings = np.vstack([self._embeddings, embedding[np.newaxis, :]])
+        self._entries.append((time.monotonic() + self.ttl.total_seconds(), response))
+
+    def _evict_expired(self) -> None:
+        """Drop expired entries, which always form a prefix of the entry list."""
+        now = time.monotonic()
+        expired = 0
+        while expired < len(self._entries) and self._entries[expired][0] <= now:
+            expired += 1
+        if expired:
+            self._embeddings = self._embeddings[expired:]
+            del self._entries[:expired]
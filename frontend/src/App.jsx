@@ -114,9 +114,9 @@ function App() {
    * This function:
    * 1. Validates input and session state
    * 2. Adds user message to chat UI immediately
-   * 3. Calls backend /run endpoint with message payload
-   * 4. Parses streaming response events and extracts agent text
-   * 5. Displays agent response in chat UI
+   * 3. Calls backend /run_sse endpoint with message payload
+   * 4. Parses server-sent events as they stream in and extracts agent text
+   * 5. Displays the agent response in chat UI, updating it as text arrives
    * 6. Handles errors with user-friendly messages
    * 
    * @async
@@ -134,8 +134,9 @@ function App() {
     setLoading(true);
 
     try {
-      // Send message to backend agent orchestrator
-      const runResponse = await fetch(`${BACKEND_URL}/run`, {
+      // Send message to backend agent orchestrator, streaming events as they
+      // are generated so the recommendation renders before it finishes
+      const runResponse = await fetch(`${BACKEND_URL}/run_sse`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({
@@ -145,7 +146,8 @@ function App() {
           new_message: {
             role: 'user',
             parts: [{ text: userMessage }]
-          }
+          },
+          streaming: true
         })
       });
 
@@ -153,32 +155,65 @@ function App() {
         throw new Error(`Backend error: ${runResponse.status}`);
       }
 
-      const data = await runResponse.json();
-      
-      // Extract text from the response events (multi-agent responses)
-      // The backend returns an array of events, each potentially containing content parts
-      let agentText = '';
-      if (Array.isArray(data)) {
-        for (const event of data) {
-          if (event.content && event.content.parts) {
-            for (const part of event.content.parts) {
-              if (part.text) {
-                agentText += part.text;
-              }
+      // Text from completed events, plus the event currently being streamed.
+      // A completed event repeats the full text of its partial chunks, so the
+      // partial buffer is dropped once the event completes.
+      let committedText = '';
+      let partialText = '';
+      let agentMessageShown = false;
+
+      const showAgentText = (text) => {
+        // Capture before the (possibly deferred) state update runs
+        const replaceLast = agentMessageShown;
+        setMessages(prev => replaceLast
+          ? [...prev.slice(0, -1), { role: 'agent', text }]
+          : [...prev, { role: 'agent', text }]);
+        agentMessageShown = true;
+      };
+
+      // Server-sent events arrive as "data: {json}" frames separated by blank lines
+      const reader = runResponse.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const frames = buffer.split('\n\n');
+        buffer = frames.pop();
+
+        for (const frame of frames) {
+          if (!frame.startsWith('data: ')) continue;
+          const event = JSON.parse(frame.slice('data: '.length));
+          if (event.error) {
+            throw new Error(event.error);
+          }
+
+          // Extract text from the event's content parts (multi-agent responses)
+          let eventText = '';
+          for (const part of event.content?.parts ?? []) {
+            if (part.text) {
+              eventText += part.text;
             }
           }
+
+          if (event.partial) {
+            partialText += eventText;
+          } else {
+            committedText += eventText;
+            partialText = '';
+          }
+          if (committedText || partialText) {
+            showAgentText(committedText + partialText);
+          }
         }
       }
 
-      // Add agent response to chat UI
-      if (agentText) {
-        setMessages(prev => [...prev, { role: 'agent', text: agentText }]);
-      } else {
-        // Fallback message if no text was extracted
-        setMessages(prev => [...prev, { 
-          role: 'agent', 
-          text: 'Sorry, I couldn\'t generate a response. Please try again.' 
-        }]);
+      // Fallback message if no text was extracted
+      if (!agentMessageShown) {
+        showAgentText('Sorry, I couldn\'t generate a response. Please try again.');
       }
 
     } catch (error) {
@@ -258,8 +293,8 @@ function App() {
             </div>
           ))}
 
-          {/* Loading indicator - animated typing dots while waiting for response */}
-          {loading && (
+          {/* Loading indicator - animated typing dots until the response starts streaming */}
+          {loading && messages[messages.length - 1]?.role !== 'agent' && (
             <div className="message agent">
               <div className="message-avatar">🤖</div>
               <div className="message-content">